@@ -11,6 +11,8 @@ from typing import Optional
 from chess_controls import (
     all_legal_moves_for_color,
     apply_move,
+    find_piece_at,
+    legal_moves,
     rc_to_square,
     square_to_rc,
 )
@@ -87,30 +89,69 @@ class MinimaxConfig:
     depth: int = 2
     randomness: float = 0.0  # 0 = deterministic best, 0.1 = a little variety
 
+    # Null-move pruning: let the side to move "pass"; if a reduced search still
+    # fails high (or low for the minimizing side), the node is cut off.
+    # Depths below count remaining plies, with the root at `depth`. The null search
+    # always keeps at least one ply, so with reduction 2 it starts at depth 4.
+    null_move: bool = False
+    null_move_reduction: int = 2      # extra plies removed from the null search
+    null_move_min_depth: int = 3      # only try a null move at this depth or more
+    null_move_zugzwang_guard: bool = True  # skip when side to move has only king + pawns
+
+    # Late-move reductions: quiet moves searched late in the list get a shallower
+    # search first, and are only re-searched at full depth if they look good.
+    late_move_reductions: bool = False
+    lmr_min_depth: int = 3            # only reduce at this depth or more (never the root)
+    lmr_move_threshold: int = 2       # this many searched moves are never reduced
+    lmr_reduction: int = 1            # plies removed from a reduced search
+
+    # Also run the full-width search and count how often the picks disagree.
+    verify_selective: bool = False
+
+@dataclass
+class SelectiveSearchStats:
+    searches: int = 0
+    different_moves: int = 0   # selective picked another move (ties included)
+    worse_moves: int = 0       # ...that scores lower in the full-width search
+    score_loss: int = 0        # total material lost by those worse moves
+    selective_nodes: int = 0
+    full_width_nodes: int = 0
+
+    @property
+    def worse_rate(self) -> float:
+        return self.worse_moves / self.searches if self.searches else 0.0
+
+    def report(self) -> str:
+        return (
+            f"selective vs full-width: {self.worse_moves}/{self.searches} worse moves "
+            f"({self.worse_rate:.1%}, total loss {self.score_loss}), "
+            f"{self.different_moves} different, nodes {self.selective_nodes} vs {self.full_width_nodes}"
+        )
+
 class MinimaxBot(BaseBot):
     name = "MinimaxBot"
     def __init__(self, config: MinimaxConfig | None = None):
         self.cfg = config or MinimaxConfig()
+        self.nodes = 0  # nodes visited by the last search
+        self.stats = SelectiveSearchStats()
+
+    @property
+    def selective(self) -> bool:
+        return self.cfg.null_move or self.cfg.late_move_reductions
 
     def choose_move(self, pieces: list, color: str):
         moves = all_legal_moves_for_color(pieces, color)
         if not moves:
             raise RuntimeError("No legal moves available.")
 
-        scored: list[tuple[int, tuple[tuple[int,int], tuple[int,int]]]] = []
-        for fr, to in moves:
-            sim = copy.deepcopy(pieces)
-            ok = apply_move(sim, fr, to, color)
-            if not ok:
-                continue
-            score = self._minimax(sim, self.cfg.depth - 1, self._other(color), color)
-            scored.append((score, (fr, to)))
+        scored = self._score_root(pieces, color, moves, self.selective)
+
+        if self.cfg.verify_selective and self.selective:
+            self._verify(pieces, color, moves, scored)
 
         if not scored:
             return random.choice(moves)
 
-        scored.sort(key=lambda x: x[0], reverse=True)
-
         # Optional “skill knob”: add a little randomness so lower skill plays worse
         if self.cfg.randomness > 0 and len(scored) > 1:
             k = max(1, int(len(scored) * self.cfg.randomness))
@@ -118,7 +159,62 @@ class MinimaxBot(BaseBot):
 
         return scored[0][1]
 
-    def _minimax(self, pieces: list, depth: int, side_to_move: str, maximizing_color: str) -> int:
+    def _verify(self, pieces: list, color: str, moves: list, selective_scored: list) -> None:
+        """
+        Runs the full-width search the played (selective) search was based on and
+        records whether the two pick a different best move, and what that costs.
+        """
+        selective_nodes = self.nodes
+        full = self._score_root(pieces, color, moves, selective=False)
+
+        self.stats.searches += 1
+        if full and selective_scored and full[0][1] != selective_scored[0][1]:
+            self.stats.different_moves += 1
+            # Root bounds are not exact for non-best moves, so score it on its own.
+            fr, to = selective_scored[0][1]
+            sim = copy.deepcopy(pieces)
+            apply_move(sim, fr, to, color)
+            score = self._minimax(sim, self.cfg.depth - 1, self._other(color), color)
+            loss = full[0][0] - score
+            if loss > 0:
+                self.stats.worse_moves += 1
+                self.stats.score_loss += loss
+        self.stats.selective_nodes += selective_nodes
+        self.stats.full_width_nodes += self.nodes
+        self.nodes = selective_nodes
+
+    def _score_root(self, pieces: list, color: str, moves: list,
+                    selective: bool) -> list[tuple[int, tuple[tuple[int,int], tuple[int,int]]]]:
+        """
+        Scores every root move, best first. Without randomness only the best score
+        is exact (later moves are bounds), which is all that is needed to pick it.
+        """
+        exact = self.cfg.randomness > 0
+        depth = self.cfg.depth
+        other = self._other(color)
+        self.nodes = 0
+
+        scored: list[tuple[int, tuple[tuple[int,int], tuple[int,int]]]] = []
+        alpha = -10**9
+        for fr, to, capture in self._ordered_moves(pieces, moves):
+            sim = copy.deepcopy(pieces)
+            ok = apply_move(sim, fr, to, color)
+            if not ok:
+                continue
+            # Root moves are never reduced: a wrong root score is a wrong move.
+            score = self._minimax(sim, depth - 1, other, color,
+                                  -10**9 if exact else alpha, 10**9, selective)
+
+            alpha = max(alpha, score)
+            scored.append((score, (fr, to)))
+
+        scored.sort(key=lambda x: x[0], reverse=True)
+        return scored
+
+    def _minimax(self, pieces: list, depth: int, side_to_move: str, maximizing_color: str,
+                 alpha: int = -10**9, beta: int = 10**9, selective: bool = False,
+                 allow_null: bool = True) -> int:
+        self.nodes += 1
         if depth <= 0:
             return material_score(pieces, maximizing_color)
 
@@ -126,22 +222,102 @@ class MinimaxBot(BaseBot):
         if not moves:
             return material_score(pieces, maximizing_color)
 
-        if side_to_move == maximizing_color:
-            best = -10**9
-            for fr, to in moves:
-                sim = copy.deepcopy(pieces)
-                if not apply_move(sim, fr, to, side_to_move):
-                    continue
-                best = max(best, self._minimax(sim, depth - 1, self._other(side_to_move), maximizing_color))
-            return best
-        else:
-            best = 10**9
-            for fr, to in moves:
-                sim = copy.deepcopy(pieces)
-                if not apply_move(sim, fr, to, side_to_move):
-                    continue
-                best = min(best, self._minimax(sim, depth - 1, self._other(side_to_move), maximizing_color))
-            return best
+        maximizing = side_to_move == maximizing_color
+        other = self._other(side_to_move)
+
+        if selective and allow_null and self._null_move_ok(pieces, depth, side_to_move):
+            # Null window just at the bound we are trying to beat.
+            r = self.cfg.null_move_reduction
+            if maximizing and beta < 10**9:
+                score = self._minimax(pieces, depth - 1 - r, other, maximizing_color,
+                                      beta - 1, beta, selective, allow_null=False)
+                if score >= beta:
+                    return beta
+            elif not maximizing and alpha > -10**9:
+                score = self._minimax(pieces, depth - 1 - r, other, maximizing_color,
+                                      alpha, alpha + 1, selective, allow_null=False)
+                if score <= alpha:
+                    return alpha
+
+        best = -10**9 if maximizing else 10**9
+        searched = 0
+        for fr, to, capture in self._ordered_moves(pieces, moves):
+            sim = copy.deepcopy(pieces)
+            if not apply_move(sim, fr, to, side_to_move):
+                continue
+
+            if selective and self._lmr_ok(sim, depth, searched, to, capture, side_to_move):
+                score = self._minimax(sim, depth - 1 - self.cfg.lmr_reduction, other,
+                                      maximizing_color, alpha, beta, selective)
+                # Only trust the reduced search if it says the move is no better.
+                if (maximizing and score > alpha) or (not maximizing and score < beta):
+                    score = self._minimax(sim, depth - 1, other, maximizing_color,
+                                          alpha, beta, selective)
+            else:
+                score = self._minimax(sim, depth - 1, other, maximizing_color,
+                                      alpha, beta, selective)
+            searched += 1
+
+            if maximizing:
+                best = max(best, score)
+                alpha = max(alpha, best)
+            else:
+                best = min(best, score)
+                beta = min(beta, best)
+            if alpha >= beta:
+                break
+        return best
+
+    def _ordered_moves(self, pieces: list, moves: list) -> list[tuple[tuple[int,int], tuple[int,int], bool]]:
+        """
+        Captures first (most valuable victim first), then quiet moves, so that the
+        moves late in the list are the ones worth reducing.
+        """
+        occupied = {p.pos: p for p in pieces}
+        tagged = []
+        for fr, to in moves:
+            target = occupied.get(to)
+            gain = PIECE_VALUE.get(target.piece_type.lower(), 0) if target is not None else 0
+            tagged.append((gain, fr, to, target is not None))
+        tagged.sort(key=lambda x: x[0], reverse=True)
+        return [(fr, to, capture) for _, fr, to, capture in tagged]
+
+    def _lmr_ok(self, after: list, depth: int, searched: int, to: tuple[int,int],
+                capture: bool, mover: str) -> bool:
+        """
+        `after` is the position after the move. Late quiet moves are reduced;
+        captures, threats (the moved piece attacks an enemy piece, the king
+        included) and pawn pushes to the last two ranks never are. Without a
+        capture search, a reduced threat would never see its follow-up capture.
+        """
+        if (
+            not self.cfg.late_move_reductions
+            or depth < self.cfg.lmr_min_depth
+            or searched < self.cfg.lmr_move_threshold
+            or capture
+        ):
+            return False
+
+        piece = find_piece_at(after, to)
+        if piece.piece_type.lower() == "pawn" and to[0] in ((0, 1) if mover == "orange" else (6, 7)):
+            return False
+        attacked = legal_moves(piece, after)
+        return not any(p.color != mover and p.pos in attacked for p in after)
+
+    def _null_move_ok(self, pieces: list, depth: int, side_to_move: str) -> bool:
+        if not self.cfg.null_move or depth < self.cfg.null_move_min_depth:
+            return False
+        # The null search must still let the opponent reply, otherwise a side that
+        # is ahead on material gets cut off with a piece hanging.
+        if depth - 1 - self.cfg.null_move_reduction < 1:
+            return False
+        if self.cfg.null_move_zugzwang_guard:
+            # King-and-pawn endings are where passing is most often better than moving.
+            return any(
+                p.color == side_to_move and p.piece_type.lower() not in ("king", "pawn")
+                for p in pieces
+            )
+        return True
 
     def _other(self, c: str) -> str:
         return "blue" if c == "orange" else "orange"
@@ -151,6 +327,7 @@ class OllamaConfig:
     model: str = "llama3.2:1b"
     temperature: float = 0.2
     top_p: float = 0.9
+    url: str = "http://localhost:11434/api/generate"
 
 class OllamaBot(BaseBot):
     name = "OllamaBot"
@@ -192,7 +369,7 @@ LEGAL MOVES:
         return random.choice(legal)
 
     def _ollama_generate(self, prompt: str) -> str:
-        url = "http://localhost:11434/api/generate"
+        url = self.cfg.url
         payload = {
             "model": self.cfg.model,
             "prompt": prompt,
@@ -0,0 +1,447 @@
+"""
+Search-speed regression benchmark for the bots in chess_ai.py.
+
+Runs every bot over a fixed set of middlegame and endgame positions and records,
+per position: seconds per move (time-to-depth for MinimaxBot), nodes and
+nodes/sec, allocations per move (count and tracemalloc peak), and how much the
+move raised the peak RSS of a fresh process. Results are compared against
+bench_baseline.json; anything slower or heavier than the baseline by more than
+the tolerance, any change in node count, or any entry missing on either side
+fails with a per-position diff.
+
+    python chess_bench.py                    # compare against the baseline
+    python chess_bench.py --update-baseline  # rewrite the baseline
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import multiprocessing
+import random
+import re
+import sys
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+try:
+    import resource  # not available on Windows
+except ImportError:
+    resource = None
+
+from chess_ai import (
+    GreedyBot, MinimaxBot, MinimaxConfig, OllamaBot, OllamaConfig, RandomBot
+)
+from piece_factory import create_piece
+from symbols import load_symbol_sets
+
+BASELINE_PATH = "bench_baseline.json"
+
+# name -> (side to move, pieces as "color type square")
+POSITIONS: dict[str, tuple[str, list[str]]] = {
+    "italian_middlegame": ("orange", [
+        "orange king g1", "orange queen d1", "orange rook a1", "orange rook f1",
+        "orange bishop c1", "orange bishop c4", "orange knight c3", "orange knight f3",
+        "orange pawn a2", "orange pawn b2", "orange pawn c2", "orange pawn d3",
+        "orange pawn e4", "orange pawn f2", "orange pawn g2", "orange pawn h2",
+        "blue king g8", "blue queen d8", "blue rook a8", "blue rook f8",
+        "blue bishop c8", "blue bishop c5", "blue knight c6", "blue knight f6",
+        "blue pawn a7", "blue pawn b7", "blue pawn c7", "blue pawn d6",
+        "blue pawn e5", "blue pawn f7", "blue pawn g7", "blue pawn h7",
+    ]),
+    "open_middlegame": ("blue", [
+        "orange king g1", "orange queen e2", "orange rook d1", "orange rook f1",
+        "orange bishop b3", "orange knight f3",
+        "orange pawn a2", "orange pawn b2", "orange pawn f2", "orange pawn g2", "orange pawn h2",
+        "blue king g8", "blue queen c7", "blue rook d8", "blue rook e8",
+        "blue bishop e6", "blue knight f6",
+        "blue pawn a7", "blue pawn b7", "blue pawn f7", "blue pawn g7", "blue pawn h7",
+    ]),
+    "rook_endgame": ("orange", [
+        "orange king g1", "orange rook d1",
+        "orange pawn a4", "orange pawn f2", "orange pawn g2", "orange pawn h2",
+        "blue king g8", "blue rook a8",
+        "blue pawn f7", "blue pawn g7", "blue pawn h7",
+    ]),
+    "minor_piece_endgame": ("blue", [
+        "orange king e3", "orange bishop d3", "orange pawn c4", "orange pawn g3",
+        "blue king e6", "blue knight f6", "blue pawn c5", "blue pawn g6",
+    ]),
+    "king_pawn_endgame": ("orange", [
+        "orange king e4", "orange pawn d4", "orange pawn e5",
+        "blue king e6", "blue pawn d5",
+    ]),
+}
+
+def build_position(name: str) -> tuple[list, str]:
+    symbol_sets = load_symbol_sets("things.json")
+    turn, spec = POSITIONS[name]
+    pieces = []
+    for entry in spec:
+        color, piece_type, square = entry.split()
+        pieces.append(create_piece(piece_type, square, "initial", symbol_sets, color))
+    return pieces, turn
+
+# ---------------------------
+# Local Ollama stub
+# ---------------------------
+
+class _OllamaStubHandler(BaseHTTPRequestHandler):
+    """
+    Answers /api/generate with the first move from the prompt's legal-move list,
+    so OllamaBot can be benchmarked without a model.
+    """
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length).decode("utf-8"))
+        m = re.search(r"^- ([a-h][1-8] [a-h][1-8])$", payload.get("prompt", ""), re.MULTILINE)
+        body = json.dumps({"response": m.group(1) if m else ""}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def _serve_ollama_stub(conn) -> None:
+    server = HTTPServer(("127.0.0.1", 0), _OllamaStubHandler)
+    conn.send(server.server_address[1])
+    server.serve_forever()
+
+def start_ollama_stub() -> tuple[multiprocessing.Process, str]:
+    """
+    Runs the stub in its own process so its allocations and RSS stay out of the
+    bot's measurements. Returns the process and the generate URL.
+    """
+    parent, child = multiprocessing.Pipe()
+    proc = multiprocessing.Process(target=_serve_ollama_stub, args=(child,), daemon=True)
+    proc.start()
+    child.close()
+    port = _receive(proc, parent, "Ollama stub")
+    return proc, f"http://127.0.0.1:{port}/api/generate"
+
+def _receive(proc: multiprocessing.Process, conn, what: str):
+    """
+    Reads the one message a helper process sends back. The parent must have closed
+    its copy of the child end, so a crashed child shows up as EOFError, not a hang.
+    """
+    try:
+        return conn.recv()
+    except EOFError:
+        proc.join()
+        raise RuntimeError(f"{what} exited with code {proc.exitcode} before reporting back") from None
+
+# ---------------------------
+# Measurement
+# ---------------------------
+
+ENDGAMES = ["rook_endgame", "minor_piece_endgame", "king_pawn_endgame"]
+
+def make_bots(ollama_url: str) -> dict:
+    return {
+        "random": lambda: RandomBot(),
+        "greedy": lambda: GreedyBot(),
+        "minimax-d1": lambda: MinimaxBot(MinimaxConfig(depth=1)),
+        "minimax-d2": lambda: MinimaxBot(MinimaxConfig(depth=2)),
+        "minimax-d3": lambda: MinimaxBot(MinimaxConfig(depth=3)),
+        "minimax-d3-selective": lambda: MinimaxBot(MinimaxConfig(
+            depth=3, null_move=True, late_move_reductions=True)),
+        "minimax-d4-selective": lambda: MinimaxBot(MinimaxConfig(
+            depth=4, null_move=True, late_move_reductions=True)),
+        "ollama-stub": lambda: OllamaBot(OllamaConfig(url=ollama_url)),
+    }
+
+# bot -> positions it runs on, when not all of POSITIONS
+BOT_POSITIONS = {
+    "minimax-d4-selective": ENDGAMES,
+}
+
+def suite_keys(bots: list[str]) -> list[str]:
+    return [
+        f"{bot_name}/{position}"
+        for bot_name in bots
+        for position in BOT_POSITIONS.get(bot_name, list(POSITIONS))
+    ]
+
+def peak_rss_kb() -> int | None:
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+def calibrate(repeats: int = 5) -> float:
+    """
+    Times a fixed pure-Python workload that touches no project code, so timings
+    can be expressed relative to how fast this machine is running right now.
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        total = 0
+        for i in range(20000):
+            total += len({(i % 8, i % 7): i}) + sum((i, i + 1))
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+def count_allocations(fn) -> int:
+    """
+    Approximate count of GC-tracked objects (instances, dicts, lists...) allocated
+    while fn runs, short-lived ones included. With the generation-0 threshold at 1,
+    CPython collects on nearly every such allocation, so counting those collections
+    follows allocation churn. Objects reused from CPython's free lists are missed.
+    """
+    collections = 0
+
+    def on_gc(phase, info):
+        nonlocal collections
+        if phase == "start" and info["generation"] == 0:
+            collections += 1
+
+    old_threshold = gc.get_threshold()
+    gc.collect()
+    gc.callbacks.append(on_gc)
+    gc.set_threshold(1, 10**6, 10**6)
+    try:
+        fn()
+    finally:
+        gc.set_threshold(*old_threshold)
+        gc.callbacks.remove(on_gc)
+    return collections
+
+def _measure_memory(bot_name: str, position: str, ollama_url: str, conn) -> None:
+    """
+    Runs in a fresh process, so the RSS growth belongs to this one move alone and
+    does not depend on which bots ran before it. Each measurement gets its own
+    move, since tracemalloc and the GC hook both slow everything down.
+    """
+    make_bot = make_bots(ollama_url)[bot_name]
+    pieces, turn = build_position(position)
+    bot = make_bot()
+    random.seed(0)
+    rss_before = peak_rss_kb()
+    bot.choose_move(pieces, turn)
+    rss_after = peak_rss_kb()
+
+    pieces, turn = build_position(position)
+    bot = make_bot()
+    random.seed(0)
+    tracemalloc.start()
+    bot.choose_move(pieces, turn)
+    _, alloc_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    pieces, turn = build_position(position)
+    bot = make_bot()
+    random.seed(0)
+    alloc_count = count_allocations(lambda: bot.choose_move(pieces, turn))
+
+    conn.send({
+        "alloc_count": alloc_count,
+        "alloc_peak_kb": round(alloc_peak / 1024, 1),
+        "peak_rss_kb": rss_after,
+        "rss_growth_kb": rss_after - rss_before if rss_after is not None else None,
+    })
+
+def measure(bot_name: str, position: str, ollama_url: str, repeats: int) -> dict:
+    make_bot = make_bots(ollama_url)[bot_name]
+    times = []
+    ratios = []
+    nodes = None
+    for _ in range(repeats):
+        # Calibrate right before each move, so a slow spell on the machine
+        # slows both sides of the ratio.
+        cal = calibrate(repeats=3)
+        pieces, turn = build_position(position)
+        bot = make_bot()
+        random.seed(0)
+        t0 = time.perf_counter()
+        bot.choose_move(pieces, turn)
+        times.append(time.perf_counter() - t0)
+        ratios.append(times[-1] / cal)
+        nodes = getattr(bot, "nodes", None)
+
+    ctx = multiprocessing.get_context("spawn")
+    parent, child = ctx.Pipe()
+    proc = ctx.Process(target=_measure_memory, args=(bot_name, position, ollama_url, child))
+    proc.start()
+    child.close()
+    memory = _receive(proc, parent, f"memory run for {bot_name}/{position}")
+    proc.join()
+
+    # Best of N, as timeit does: the minimum is the least disturbed by other load.
+    seconds = min(times)
+    return {
+        "seconds_per_move": round(seconds, 6),
+        # seconds_per_move in units of calibrate(): comparable across machines and load
+        "relative_time": round(min(ratios), 3),
+        "nodes": nodes,
+        "nodes_per_sec": round(nodes / seconds, 1) if nodes and seconds > 0 else None,
+        **memory,
+    }
+
+def run_suite(bots: list[str] | None = None, repeats: int = 5) -> dict[str, dict]:
+    proc, url = start_ollama_stub()
+    try:
+        results: dict[str, dict] = {}
+        for key in suite_keys(bots or list(make_bots(url))):
+            bot_name, position = key.split("/")
+            results[key] = measure(bot_name, position, url, repeats)
+        return results
+    finally:
+        proc.terminate()
+        proc.join()
+
+# ---------------------------
+# Baseline comparison
+# ---------------------------
+
+# metric -> which tolerance applies. peak_rss_kb is the whole interpreter, so only
+# the move's own rss_growth_kb is checked.
+CHECKED_METRICS = {
+    "relative_time": "time",
+    "nodes": "nodes",
+    "alloc_count": "size",
+    "alloc_peak_kb": "size",
+    "rss_growth_kb": "rss",
+}
+
+def compare(results: dict, baseline: dict, time_tolerance: float, tolerance: float,
+            min_seconds: float = 0.02, node_tolerance: float = 0.0,
+            min_rss_kb: int = 512) -> list[str]:
+    """
+    Returns one line per regression: a metric that grew past baseline * (1 + tolerance).
+    Node counts are deterministic, so they fail on any change past node_tolerance,
+    up or down. A timing only counts when the move also got at least min_seconds
+    slower, and RSS growth only when it grew by min_rss_kb, since both move in
+    steps bigger than any sensible tolerance for short moves.
+    """
+    regressions = []
+    for key, current in results.items():
+        base = baseline[key]
+        for metric, kind in CHECKED_METRICS.items():
+            old, new = base.get(metric), current.get(metric)
+            if old is None or new is None:
+                continue
+            if kind == "nodes":
+                failed = abs(new - old) > old * node_tolerance
+            elif kind == "time":
+                slower = current["seconds_per_move"] - base["seconds_per_move"]
+                failed = slower >= min_seconds and new > old * (1 + time_tolerance)
+            elif kind == "rss":
+                failed = new - old >= min_rss_kb and new > old * (1 + tolerance)
+            else:
+                failed = new > old * (1 + tolerance)
+            if failed:
+                change = f"{(new - old) / old:+.0%}" if old else "new"
+                regressions.append(f"{key:40} {metric:18} {old:>12} -> {new:>12} ({change})")
+    return regressions
+
+def unmatched_keys(results: dict, baseline: dict, bots: list[str]) -> list[str]:
+    """
+    Lists benchmark entries that exist only in the results or only in the baseline
+    (for the bots that were run), e.g. a renamed position or a bot that was removed.
+    """
+    lines = [f"{key:40} not in baseline" for key in results if key not in baseline]
+    lines += [
+        f"{key:40} in baseline but not run"
+        for key in baseline
+        if key not in results and key.split("/")[0] in bots
+    ]
+    return lines
+
+def updated_baseline(results: dict, baseline: dict, all_bots: list[str]) -> dict:
+    """
+    Replaces every entry of the bots that were run and drops bots that no longer exist.
+    """
+    ran = {key.split("/")[0] for key in results}
+    kept = {
+        key: value for key, value in baseline.items()
+        if key.split("/")[0] in all_bots and key.split("/")[0] not in ran
+    }
+    return {**kept, **results}
+
+def print_results(results: dict, baseline: dict) -> None:
+    print(f"{'bot/position':40} {'s/move':>10} {'nodes':>8} {'nodes/s':>10} {'allocs':>10} "
+          f"{'alloc KB':>10} {'+rss KB':>8} {'vs base':>8}")
+    for key, r in results.items():
+        base = baseline.get(key)
+        delta = ""
+        if base and base.get("relative_time"):
+            delta = f"{r['relative_time'] / base['relative_time'] - 1:+.0%}"
+        elif base is None:
+            delta = "new"
+        print(
+            f"{key:40} {r['seconds_per_move']:>10.4f} {r['nodes'] or '-':>8} "
+            f"{r['nodes_per_sec'] or '-':>10} {r['alloc_count']:>10} {r['alloc_peak_kb']:>10} "
+            f"{'-' if r['rss_growth_kb'] is None else r['rss_growth_kb']:>8} {delta:>8}"
+        )
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark chess bots against a stored baseline.")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="write results as the new baseline")
+    parser.add_argument("--bots", nargs="*", help="subset of bots to run (default: all)")
+    parser.add_argument("--repeats", type=int, default=5, help="timed runs per position (fastest is kept)")
+    parser.add_argument("--time-tolerance", type=float, default=0.5, help="allowed slowdown, 0.5 = +50%%")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed growth in allocations and memory")
+    parser.add_argument("--node-tolerance", type=float, default=0.0,
+                        help="allowed change in node counts, either way (default: exact)")
+    parser.add_argument("--min-rss-kb", type=int, default=512,
+                        help="ignore RSS growth smaller than this many KB")
+    parser.add_argument("--min-seconds", type=float, default=0.02,
+                        help="ignore slowdowns smaller than this many seconds per move")
+    args = parser.parse_args(argv)
+
+    all_bots = list(make_bots(""))
+    bots = args.bots or all_bots
+    unknown = [b for b in bots if b not in all_bots]
+    if unknown:
+        parser.error(f"unknown bot(s) {unknown}; choose from {all_bots}")
+
+    try:
+        results = run_suite(bots, args.repeats)
+    except RuntimeError as e:
+        print(f"BENCHMARK FAILED: {e}")
+        return 1
+    path = Path(args.baseline)
+    baseline = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    print_results(results, baseline)
+
+    if args.update_baseline:
+        baseline = updated_baseline(results, baseline, all_bots)
+        path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"\nBaseline written to {path}")
+        return 0
+
+    if not baseline:
+        print(f"\nNo baseline at {path}; run with --update-baseline first.")
+        return 1
+
+    unmatched = unmatched_keys(results, baseline, bots)
+    regressions = compare(
+        {k: v for k, v in results.items() if k in baseline},
+        baseline, args.time_tolerance, args.tolerance, args.min_seconds,
+        args.node_tolerance, args.min_rss_kb,
+    )
+    if unmatched:
+        print(f"\nBASELINE MISMATCH: {len(unmatched)} entries without a counterpart; "
+              "re-run with --update-baseline if intended:")
+        for line in unmatched:
+            print("  " + line)
+    if regressions:
+        print(f"\nREGRESSION: {len(regressions)} metric(s) past tolerance:")
+        for line in regressions:
+            print("  " + line)
+    if unmatched or regressions:
+        return 1
+
+    print("\nNo regressions against baseline.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
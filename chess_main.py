@@ -33,7 +33,15 @@ def pick_player(color: str):
             rand_f = float(randomness)
         except:
             rand_f = 0.0
-        return MinimaxBot(MinimaxConfig(depth=depth_i, randomness=max(0.0, min(1.0, rand_f))))
+        selective = input("Selective search (null-move + late-move reductions)? y/N: ").strip().lower() == "y"
+        verify = selective and input("Verify against full-width search (slower)? y/N: ").strip().lower() == "y"
+        return MinimaxBot(MinimaxConfig(
+            depth=depth_i,
+            randomness=max(0.0, min(1.0, rand_f)),
+            null_move=selective,
+            late_move_reductions=selective,
+            verify_selective=verify,
+        ))
     if choice == "5":
         temp = input("Ollama temperature (e.g. 0.1-1.0): ").strip()
         try:
@@ -132,5 +140,9 @@ def main():
         if moved_piece:
             turn = "blue" if turn == "orange" else "orange"
 
+    for color, bot in (("orange", orange_player), ("blue", blue_player)):
+        if isinstance(bot, MinimaxBot) and bot.cfg.verify_selective:
+            print(f"{color} {bot.name} {bot.stats.report()}")
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,84 @@
+"""
+Sanity checks for MinimaxBot's search.
+
+1. Full-width search (null_move=False, late_move_reductions=False) must give the
+   same best root score as the original plain minimax, which is kept here as the
+   reference. Alpha-beta and move ordering may change which of several equal
+   moves is picked, never how good the pick is.
+2. Selective search is run with verify_selective=True and its report printed,
+   so the cost of null-move pruning and LMR is visible per position.
+
+    python chess_search_check.py
+"""
+from __future__ import annotations
+
+import copy
+import sys
+
+from chess_ai import MinimaxBot, MinimaxConfig, material_score
+from chess_bench import ENDGAMES, POSITIONS, build_position
+from chess_controls import all_legal_moves_for_color, apply_move
+
+def plain_minimax(pieces: list, depth: int, side_to_move: str, maximizing_color: str) -> int:
+    """
+    MinimaxBot's search before alpha-beta: every move, every ply.
+    """
+    if depth <= 0:
+        return material_score(pieces, maximizing_color)
+
+    moves = all_legal_moves_for_color(pieces, side_to_move)
+    if not moves:
+        return material_score(pieces, maximizing_color)
+
+    other = "blue" if side_to_move == "orange" else "orange"
+    scores = []
+    for fr, to in moves:
+        sim = copy.deepcopy(pieces)
+        if apply_move(sim, fr, to, side_to_move):
+            scores.append(plain_minimax(sim, depth - 1, other, maximizing_color))
+    if not scores:
+        return material_score(pieces, maximizing_color)
+    return max(scores) if side_to_move == maximizing_color else min(scores)
+
+def check_full_width(depths: dict[str, list[int]]) -> list[str]:
+    failures = []
+    for position, position_depths in depths.items():
+        for depth in position_depths:
+            pieces, turn = build_position(position)
+            expected = plain_minimax(pieces, depth, turn, turn)
+
+            bot = MinimaxBot(MinimaxConfig(depth=depth))
+            scored = bot._score_root(pieces, turn, all_legal_moves_for_color(pieces, turn), selective=False)
+            got = scored[0][0]
+
+            status = "ok" if got == expected else "MISMATCH"
+            print(f"full-width  {position:22} depth {depth}: plain {expected:>4}, alpha-beta {got:>4}  {status}")
+            if got != expected:
+                failures.append(f"{position} depth {depth}: plain minimax {expected}, MinimaxBot {got}")
+    return failures
+
+def report_selective(depth: int) -> None:
+    for position in POSITIONS:
+        pieces, turn = build_position(position)
+        bot = MinimaxBot(MinimaxConfig(
+            depth=depth, null_move=True, late_move_reductions=True, verify_selective=True))
+        bot.choose_move(pieces, turn)
+        print(f"selective   {position:22} depth {depth}: {bot.stats.report()}")
+
+def main() -> int:
+    # Plain minimax is exponential, so depth 3 only runs on the small endgames.
+    depths = {position: [1, 2] + ([3] if position in ENDGAMES else []) for position in POSITIONS}
+    failures = check_full_width(depths)
+    print()
+    report_selective(depth=4)
+
+    if failures:
+        print(f"\nFAILED: {len(failures)} full-width score(s) differ from plain minimax:")
+        for line in failures:
+            print("  " + line)
+        return 1
+    print("\nFull-width search matches plain minimax.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())